@@ -6,12 +6,69 @@ Scans existing .amazonq folder and generates install_q_framework.sh with all con
 """
 
 import argparse
+import fnmatch
+import gzip
+import hashlib
+import io
+import mmap
 import os
 import sys
-import base64
+import re
 import shlex
 from pathlib import Path
 import stat
+import tarfile
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    # pybase64 wraps libbase64's SIMD codecs; fall back to the stdlib codec
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Walk directories through open descriptors where the platform allows it,
+# so each open resolves only a leaf name instead of the whole path
+DIR_FD_SUPPORTED = os.open in os.supports_dir_fd and os.scandir in os.supports_fd
+
+# Files are handed to the read pool in batches to amortise the cost of a
+# future and queue round-trip per file
+READ_BATCH_SIZE = 64
+
+# 57 input bytes encode to one 76-column base64 line; the archive is
+# encoded in chunks of whole lines so it never sits in memory at once
+BASE64_LINE_BYTES = 57
+BASE64_CHUNK_SIZE = BASE64_LINE_BYTES * 1024
+
+# The archive is gzipped: tar pads every member to 512 bytes and the
+# stream to a 10 KiB record, which would otherwise be embedded as base64
+ARCHIVE_COMPRESSLEVEL = 6
+
+# Plain text files are embedded verbatim in quoted here-docs ending at
+# this delimiter; bytes other than tab and newline that a terminal or
+# editor could mangle keep a file in the base64 archive instead
+HEREDOC_DELIMITER = '__Q_FRAMEWORK_EOF__'
+HEREDOC_UNSAFE_BYTES = re.compile(rb'[\x00-\x08\x0b-\x1f\x7f]')
+
+# Files sharing content are only copied at install time from this size:
+# a copy costs a process, while smaller repeats cost little to extract
+# and usually fall inside the 32 KiB window gzip compresses them within
+DEDUP_MIN_SIZE = 32 * 1024
+
+# Characters that make an exclusion pattern a wildcard for fnmatch
+WILDCARD_CHARS = frozenset('*?[')
+
+# Leading bytes checked for a NUL to detect binary files. One page costs
+# the same single read as 1 KiB and catches more binaries.
+BINARY_PROBE_SIZE = 4096
+
+# Files larger than this are not read while scanning: each one is
+# memory-mapped, hashed and archived in turn while the archive is written
+LARGE_FILE_THRESHOLD = 1024 * 1024
+
+# Extensions that are always text and skip the binary content probe
+TEXT_EXTENSIONS = frozenset({
+    '.md', '.py', '.sh', '.json', '.yaml', '.yml', '.txt', '.toml', '.cfg', '.ini'
+})
 
 def show_help():
     """Display comprehensive help information"""
@@ -64,6 +121,7 @@ EXCLUSION PATTERNS:
 REQUIREMENTS:
     - At least one included path must exist in source directory
     - Included paths should contain relevant AmazonQ content
+    - Optional: pybase64 (pip install pybase64) for faster encoding
 
 OUTPUT:
     Creates install_q_framework.sh containing all scanned content and structure.
@@ -72,35 +130,182 @@ OUTPUT:
     print(help_text)
 
 def escape_shell_content(content):
-    """Escape content for safe embedding in shell script"""
-    # Use base64 encoding for complete safety with any content
-    encoded = base64.b64encode(content.encode('utf-8')).decode('ascii')
+    """Encode raw bytes for safe embedding in shell script"""
+    # Use base64 encoding for complete safety with any content,
+    # wrapped at 76 columns like the base64 command line tool
+    encoded = base64.encodebytes(content).decode('ascii')
     return encoded
 
-def is_binary_file(filepath):
-    """Check if file appears to be binary"""
+def heredoc_text(content):
+    """Return content as text if it can be embedded verbatim in a here-doc, else None"""
+    # Large files are left to the streamed archive, as are files not
+    # ending in a newline, which a here-doc cannot reproduce exactly
+    if not isinstance(content, bytes):
+        return None
+    if content and not content.endswith(b'\n'):
+        return None
+    if HEREDOC_UNSAFE_BYTES.search(content):
+        return None
+    if b'\n' + HEREDOC_DELIMITER.encode('ascii') + b'\n' in b'\n' + content:
+        return None
     try:
-        with open(filepath, 'rb') as f:
-            chunk = f.read(1024)
-            return b'\0' in chunk
-    except:
-        return True
-
-def matches_pattern(path_str, pattern):
-    """Check if path matches a pattern (supports wildcards)"""
-    import fnmatch
-    return fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(str(Path(path_str).name), pattern)
-
-def should_exclude(path, exclude_patterns, verbose=False):
-    """Check if path should be excluded based on patterns"""
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+class Base64LineWriter:
+    """Write-only file object that base64-encodes its input into an output file"""
+    
+    def __init__(self, outfile):
+        self.outfile = outfile
+        self.pending = bytearray()
+    
+    def write(self, data):
+        self.pending += data
+        if len(self.pending) >= BASE64_CHUNK_SIZE:
+            # Encode whole lines only so chunk boundaries don't show in the output
+            whole = len(self.pending) - len(self.pending) % BASE64_LINE_BYTES
+            self.outfile.write(escape_shell_content(self.pending[:whole]))
+            del self.pending[:whole]
+        return len(data)
+    
+    def close(self):
+        # Only called once the archive is complete: padding in the middle
+        # of the output would corrupt the concatenated base64
+        if self.pending:
+            self.outfile.write(escape_shell_content(self.pending))
+            self.pending.clear()
+
+def write_archive(files, outfile, archived_by_hash):
+    """Stream file contents to outfile as a base64-encoded, gzipped tar archive, returning large duplicates to copy"""
+    copied_files = []
+    encoder = Base64LineWriter(outfile)
+    # A zero mtime keeps the gzip header, and so the script, reproducible
+    compressor = gzip.GzipFile(fileobj=encoder, mode='wb', compresslevel=ARCHIVE_COMPRESSLEVEL, mtime=0)
+    with compressor, tarfile.open(fileobj=compressor, mode='w|', format=tarfile.PAX_FORMAT) as archive:
+        for file_info in files:
+            # Ownership and timestamps are not recorded; the installer
+            # extracts with the current user, umask and time
+            member = tarfile.TarInfo(file_info['path'])
+            member.size = file_info['size']
+            member.mode = 0o666
+            
+            content = file_info['content']
+            if content is not None:
+                archive.addfile(member, io.BytesIO(content))
+                continue
+            
+            # Large files are mapped only while they are hashed and
+            # archived, so one mapping and descriptor are held at a time.
+            # Size and digest both come from the mapping, so the archive
+            # and the copy decisions always agree with each other.
+            try:
+                with open(file_info['source'], 'rb') as source, \
+                        mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        content.madvise(mmap.MADV_SEQUENTIAL)
+                    
+                    digest = hashlib.blake2b(content, digest_size=16).digest()
+                    source_path = archived_by_hash.get(digest)
+                    if source_path is not None:
+                        copied_files.append((file_info['path'], source_path))
+                        continue
+                    archived_by_hash[digest] = file_info['path']
+                    
+                    member.size = len(content)
+                    archive.addfile(member, content)
+            except (OSError, ValueError) as e:
+                # mmap raises ValueError for a file emptied since the scan
+                raise OSError(f"Error reading {file_info['path']}: {e}") from e
+    encoder.close()
+    return copied_files
+
+def read_file_content(filepath, dir_fd=None):
+    """Read and hash file content in one pass, returning None if file appears to be binary"""
+    with open(os.open(filepath, os.O_RDONLY, dir_fd=dir_fd), 'rb') as f:
+        known_text = os.path.splitext(filepath)[1].lower() in TEXT_EXTENSIONS
+        
+        size = os.fstat(f.fileno()).st_size
+        if size > LARGE_FILE_THRESHOLD:
+            # Large files are only probed here; write_archive maps them
+            if not known_text and b'\0' in f.read(BINARY_PROBE_SIZE):
+                return None
+            return {'content': None, 'size': size, 'digest': None}
+        
+        if known_text:
+            content = f.read()
+        else:
+            head = f.read(BINARY_PROBE_SIZE)
+            if b'\0' in head:
+                return None
+            content = head + f.read()
+    
+    # Only files large enough to be copied at install time need a digest
+    digest = None
+    if len(content) >= DEDUP_MIN_SIZE:
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+    
+    return {
+        'content': content,
+        'size': len(content),
+        'digest': digest
+    }
+
+def read_file_batch(filepaths, dir_fd=None):
+    """Read a batch of files, returning (content, error) pairs in order"""
+    results = []
+    for filepath in filepaths:
+        try:
+            results.append((read_file_content(filepath, dir_fd), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+def compile_exclude_patterns(exclude_patterns):
+    """Split exclusion patterns into a set of literals and a regex of wildcards"""
+    # Literal patterns only ever match a whole path or name exactly, so
+    # a set lookup answers them without running the regex
+    literal_patterns = frozenset(
+        pattern for pattern in exclude_patterns if not WILDCARD_CHARS.intersection(pattern)
+    )
+    wildcard_patterns = [
+        (index, pattern) for index, pattern in enumerate(exclude_patterns)
+        if pattern not in literal_patterns
+    ]
+    
+    if not wildcard_patterns:
+        return literal_patterns, None
+    # Each pattern gets a named group so a match can report which one hit
+    wildcard_regex = re.compile('|'.join(
+        f'(?P<p{index}>{fnmatch.translate(pattern)})'
+        for index, pattern in wildcard_patterns
+    ))
+    return literal_patterns, wildcard_regex
+
+def should_exclude(path, exclude_patterns, exclude_matcher, verbose=False):
+    """Check if path should be excluded based on compiled patterns"""
+    literal_patterns, wildcard_regex = exclude_matcher
+    if not literal_patterns and wildcard_regex is None:
+        return False
+    
     path_str = str(path)
+    name = os.path.basename(path_str)
+    
+    if path_str in literal_patterns:
+        pattern = path_str
+    elif name in literal_patterns:
+        pattern = name
+    else:
+        match = None
+        if wildcard_regex is not None:
+            match = wildcard_regex.match(path_str) or wildcard_regex.match(name)
+        if match is None:
+            return False
+        pattern = exclude_patterns[int(match.lastgroup[1:])]
     
-    for pattern in exclude_patterns:
-        if matches_pattern(path_str, pattern):
-            if verbose:
-                print(f"  → Excluding {path_str} (matches pattern: {pattern})")
-            return True
-    return False
+    if verbose:
+        print(f"  → Excluding {path_str} (matches pattern: {pattern})")
+    return True
 
 def scan_paths(source_path, include_paths, exclude_patterns, verbose=False):
     """Scan specified paths and return file structure with content"""
@@ -113,101 +318,177 @@ def scan_paths(source_path, include_paths, exclude_patterns, verbose=False):
         if verbose:
             print(f"  → {message}")
     
+    # Translate the patterns once instead of on every path checked
+    exclude_matcher = compile_exclude_patterns(exclude_patterns)
+    
+    # Directories are keyed by (device, inode): cheaper to hash than path
+    # strings, and aliases of the same directory are only walked once.
+    # Inode numbers are only unique per filesystem, hence the device.
     processed_dirs = set()
+    # Files are keyed by relative path, so a file under both a file and a
+    # directory include is only emitted once; hard links keep both paths
+    added_files = set()
+    pending_files = []
     
-    for include_path in include_paths:
-        full_path = source_path / include_path
+    def add_files(file_paths, file_rel_paths, dir_fd=None):
+        # Reads are independent per file and spend their time outside the
+        # GIL, so they run on a thread pool while the walk continues
+        futures = []
+        for start in range(0, len(file_paths), READ_BATCH_SIZE):
+            end = start + READ_BATCH_SIZE
+            future = executor.submit(read_file_batch, file_paths[start:end], dir_fd)
+            pending_files.append((future, file_rel_paths[start:end]))
+            futures.append(future)
+        return futures
+    
+    def scan_directory(dir_path, rel_path, parent_fd=None):
+        # Check if directory should be excluded
+        if should_exclude(rel_path, exclude_patterns, exclude_matcher, verbose):
+            return
         
-        if not full_path.exists():
-            log_verbose(f"Include path does not exist: {include_path}")
-            continue
-            
-        log_verbose(f"Processing include path: {include_path}")
+        # The key comes from the opened directory itself: a scandir entry's
+        # inode at a mount point names the covered directory, not the mount
+        try:
+            if DIR_FD_SUPPORTED:
+                dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY, dir_fd=parent_fd)
+                listing = dir_fd
+            else:
+                dir_fd = None
+                listing = dir_path
+        except OSError as e:
+            log_verbose(f"Error reading directory {rel_path}: {e}")
+            return
         
-        if full_path.is_file():
-            # Single file
-            if should_exclude(include_path, exclude_patterns, verbose):
-                continue
-                
+        try:
             try:
-                if is_binary_file(full_path):
-                    log_verbose(f"Skipping binary file: {include_path}")
-                    continue
-                
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                structure['files'].append({
-                    'path': include_path,
-                    'content': content,
-                    'size': len(content)
-                })
-                
-                log_verbose(f"Added file: {include_path} ({len(content)} chars)")
+                dir_stat = os.stat(listing)
+            except OSError as e:
+                log_verbose(f"Error reading directory {rel_path}: {e}")
+                return
+            
+            # Add directory to structure (avoid duplicates)
+            dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+            if dir_key in processed_dirs:
+                log_verbose(f"Directory already scanned: {rel_path}")
+                return
+            processed_dirs.add(dir_key)
+            structure['directories'].append(rel_path)
+            log_verbose(f"Found directory: {rel_path}")
+            
+            # DirEntry caches the file type from the directory listing,
+            # so classifying entries costs no extra stat calls. When listing
+            # a descriptor, entry.path is the bare name relative to it.
+            try:
+                with os.scandir(listing) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                log_verbose(f"Error reading directory {rel_path}: {e}")
+                return
+            
+            # Children of the source root get no './' prefix, matching
+            # how Path joins them
+            join_base = '' if rel_path == '.' else rel_path
+            
+            subdirs = []
+            file_paths = []
+            file_rel_paths = []
+            for entry in entries:
+                # Relative paths are plain strings: os.path.join is much
+                # cheaper than building a Path object per entry
+                entry_rel_path = os.path.join(join_base, entry.name)
                 
-            except Exception as e:
-                log_verbose(f"Error reading {include_path}: {e}")
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, entry_rel_path))
+                elif entry.is_file():
+                    # Check if file should be excluded
+                    if should_exclude(entry_rel_path, exclude_patterns, exclude_matcher, verbose):
+                        continue
+                    if entry_rel_path in added_files:
+                        log_verbose(f"File already added: {entry_rel_path}")
+                        continue
+                    added_files.add(entry_rel_path)
+                    file_paths.append(entry.path)
+                    file_rel_paths.append(entry_rel_path)
+            
+            file_futures = add_files(file_paths, file_rel_paths, dir_fd)
+            
+            # Process subdirectories
+            for subdir_path, subdir_rel_path in subdirs:
+                scan_directory(subdir_path, subdir_rel_path, dir_fd)
+            
+            # Reads in this directory must finish before its descriptor closes
+            wait(file_futures)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for include_path in include_paths:
+            full_path = source_path / include_path
+            
+            # Paths are installed relative to the install directory, so an
+            # include must lie under the source root; tar refuses members
+            # with '..' and strips a leading '/'
+            include_rel_path = os.path.relpath(full_path, source_path)
+            if include_rel_path == os.pardir or include_rel_path.startswith(os.pardir + os.sep):
+                print(f"Warning: Skipping include path outside source directory: {include_path}")
+                continue
+            
+            # One stat call answers exists/is_file/is_dir together
+            try:
+                path_stat = os.stat(full_path)
+            except OSError:
+                log_verbose(f"Include path does not exist: {include_path}")
                 continue
                 
-        elif full_path.is_dir():
-            # Directory - walk recursively
-            for root, dirs, files in os.walk(full_path):
-                root_path = Path(root)
-                
-                # Get relative path from source
-                try:
-                    rel_path = root_path.relative_to(source_path)
-                except ValueError:
+            log_verbose(f"Processing include path: {include_path}")
+            
+            if stat.S_ISREG(path_stat.st_mode):
+                # Single file
+                file_rel_path = include_rel_path
+                if should_exclude(file_rel_path, exclude_patterns, exclude_matcher, verbose):
+                    continue
+                if file_rel_path in added_files:
+                    log_verbose(f"File already added: {file_rel_path}")
                     continue
+                added_files.add(file_rel_path)
+                add_files([full_path], [file_rel_path])
                 
-                # Check if directory should be excluded
-                if should_exclude(rel_path, exclude_patterns, verbose):
-                    dirs.clear()  # Don't recurse into excluded directories
+                # Its parent directory is not scanned, so list it to be created
+                parent_dir = os.path.dirname(file_rel_path)
+                if parent_dir and parent_dir not in structure['directories']:
+                    structure['directories'].append(parent_dir)
+                    
+            elif stat.S_ISDIR(path_stat.st_mode):
+                # Directory - walk recursively
+                scan_directory(full_path, include_rel_path)
+        
+        # Results are collected in submission order to keep the output
+        # deterministic
+        for future, file_rel_paths in pending_files:
+            for file_rel_path, (loaded, error) in zip(file_rel_paths, future.result()):
+                if error is not None:
+                    log_verbose(f"Error reading {file_rel_path}: {error}")
                     continue
                 
-                # Add directory to structure (avoid duplicates)
-                rel_path_str = str(rel_path)
-                if rel_path_str not in processed_dirs:
-                    structure['directories'].append(rel_path_str)
-                    processed_dirs.add(rel_path_str)
-                    log_verbose(f"Found directory: {rel_path_str}")
+                if loaded is None:
+                    log_verbose(f"Skipping binary file: {file_rel_path}")
+                    continue
                 
-                # Process subdirectories
-                dirs[:] = [d for d in dirs if not should_exclude(rel_path / d, exclude_patterns, verbose)]
+                structure['files'].append({
+                    'path': file_rel_path,
+                    'content': loaded['content'],
+                    'size': loaded['size'],
+                    'digest': loaded['digest'],
+                    'source': os.path.join(source_path, file_rel_path)
+                })
                 
-                # Add files in this directory
-                for filename in files:
-                    file_path = root_path / filename
-                    file_rel_path = rel_path / filename
-                    
-                    # Check if file should be excluded
-                    if should_exclude(file_rel_path, exclude_patterns, verbose):
-                        continue
-                    
-                    try:
-                        if is_binary_file(file_path):
-                            log_verbose(f"Skipping binary file: {file_rel_path}")
-                            continue
-                        
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        structure['files'].append({
-                            'path': str(file_rel_path),
-                            'content': content,
-                            'size': len(content)
-                        })
-                        
-                        log_verbose(f"Added file: {file_rel_path} ({len(content)} chars)")
-                        
-                    except Exception as e:
-                        log_verbose(f"Error reading {file_rel_path}: {e}")
-                        continue
+                log_verbose(f"Added file: {file_rel_path} ({loaded['size']} bytes)")
     
     return structure
 
-def generate_shell_script(structure, verbose=False):
-    """Generate complete shell script from scanned structure"""
+def generate_shell_script(structure, outfile, verbose=False):
+    """Generate complete shell script from scanned structure and write it to outfile"""
     
     script_header = '''#!/bin/bash
 
@@ -355,49 +636,138 @@ backup_file() {
     return 1
 }
 
-# Function to create file from base64 content
-create_file_from_base64() {
-    local file_path=$1
-    local base64_content=$2
+# Function to write a file from here-doc content on stdin
+write_text_file() {
+    cat > "$1"
+}
+
+# Function to create all files from the embedded archive
+create_files() {
+    print_status $BLUE "Creating files..."
+    local file_path
     
-    log_dry_run "Would create file: $file_path"
+    for file_path in "${FRAMEWORK_FILES[@]}"; do
+        log_dry_run "Would create file: $file_path"
+        
+        if [[ "$DRY_RUN" == false ]]; then
+            # Backup existing file if it exists and force is not set
+            backup_file "$file_path"
+        fi
+    done
     
     if [[ "$DRY_RUN" == false ]]; then
-        # Backup existing file if it exists and force is not set
-        backup_file "$file_path"
+        # Decode and unpack every file in a single pass
+        if ! extract_archive || ! create_text_files; then
+            print_status $RED "✗ Failed to extract files"
+            exit 1
+        fi
         
-        # Create directory if it doesn't exist
-        mkdir -p "$(dirname "$file_path")"
+        # Files sharing content with an archived file are copied from it;
+        # their directories were all created by create_directories
+        local index
+        for ((index = 0; index < ${#FRAMEWORK_COPIES[@]}; index += 2)); do
+            if ! cp "${FRAMEWORK_COPIES[index + 1]}" "${FRAMEWORK_COPIES[index]}"; then
+                print_status $RED "✗ Failed to create file: ${FRAMEWORK_COPIES[index]}"
+                exit 1
+            fi
+        done
         
-        # Decode and create the file
-        echo "$base64_content" | base64 -d > "$file_path"
-        log_verbose "Created file: $file_path"
-        print_status $GREEN "✓ Created file: $file_path"
+        for file_path in "${FRAMEWORK_FILES[@]}"; do
+            log_verbose "Created file: $file_path"
+            print_status $GREEN "✓ Created file: $file_path"
+        done
     fi
 }
 '''
 
+    # Sections are written as they are generated so the script is never
+    # held in memory as a whole. Listings only hold paths, so each one is
+    # joined and written in a single call rather than a write per line.
+    outfile.write(script_header)
+    
     # Add directory creation section
-    directories_section = "\n# Create all directories\ncreate_directories() {\n"
-    directories_section += "    print_status $BLUE \"Creating directory structure...\"\n"
+    outfile.write("\n# Create all directories\ncreate_directories() {\n")
+    outfile.write("    print_status $BLUE \"Creating directory structure...\"\n")
+    outfile.write(''.join([
+        f'    create_directory "{directory}"\n'
+        for directory in sorted(structure['directories'])
+    ]))
+    outfile.write("}\n")
+
+    # Identical contents are archived once; other files with the same
+    # content are copied from the archived one at install time. Large
+    # files are only hashed as they are archived, by write_archive.
+    archived_files = []
+    copied_files = []
+    archived_by_hash = {}
+    
+    for file_info in structure['files']:
+        digest = file_info['digest']
+        if digest is None:
+            archived_files.append(file_info)
+            continue
+        
+        source_path = archived_by_hash.get(digest)
+        
+        if source_path is None:
+            archived_by_hash[digest] = file_info['path']
+            archived_files.append(file_info)
+        else:
+            copied_files.append((file_info['path'], source_path))
     
-    for directory in sorted(structure['directories']):
-        directories_section += f'    create_directory "{directory}"\n'
+    # Add file list section
+    outfile.write("\n# All files created by this script\nFRAMEWORK_FILES=(\n")
+    outfile.write(''.join([
+        f'    "{file_info["path"]}" # {file_info["size"]} bytes\n'
+        for file_info in structure['files']
+    ]))
+    outfile.write(")\n")
     
-    directories_section += "}\n"
+    # Plain text files are written verbatim from quoted here-docs, which
+    # avoids the base64 size overhead and a decode at install time
+    text_files = []
+    binary_files = []
+    
+    for file_info in archived_files:
+        text = heredoc_text(file_info['content'])
+        if text is None:
+            binary_files.append(file_info)
+        else:
+            text_files.append((file_info['path'], text))
+    
+    # Add text file section; the fixed text around each here-doc is built
+    # once and each file is written with a single call
+    outfile.write("\n# Create all plain text files\ncreate_text_files() {\n")
+    
+    heredoc_open = f"\" <<'{HEREDOC_DELIMITER}' || return 1\n"
+    heredoc_close = f"{HEREDOC_DELIMITER}\n"
+    for file_path, text in text_files:
+        outfile.write('    write_text_file "' + file_path + heredoc_open + text + heredoc_close)
+    
+    outfile.write("    return 0\n}\n")
 
-    # Add file creation section
-    files_section = "\n# Create all files\ncreate_files() {\n"
-    files_section += "    print_status $BLUE \"Creating files...\"\n"
+    # Add archive section; all other files are decoded by one base64 and
+    # one tar process instead of a base64 process per file
+    outfile.write("\n# Extract all other files from the embedded archive\nextract_archive() {\n")
     
-    for file_info in structure['files']:
-        file_path = file_info['path']
-        encoded_content = escape_shell_content(file_info['content'])
-        
-        files_section += f'\n    # Creating {file_path} ({file_info["size"]} chars)\n'
-        files_section += f'    create_file_from_base64 "{file_path}" "{encoded_content}"\n'
+    large_copies = []
+    if binary_files:
+        outfile.write("    base64 -d <<'__Q_FRAMEWORK_ARCHIVE__' | tar -xzmf - --no-same-owner --no-same-permissions\n")
+        large_copies = write_archive(binary_files, outfile, archived_by_hash)
+        copied_files += large_copies
+        outfile.write("__Q_FRAMEWORK_ARCHIVE__\n")
+    else:
+        outfile.write("    return 0\n")
+    
+    outfile.write("}\n")
     
-    files_section += "}\n"
+    # Add duplicate content section as destination/source pairs
+    outfile.write("\n# Files with the same content as an archived file\nFRAMEWORK_COPIES=(\n")
+    outfile.write(''.join([
+        f'    "{file_path}" "{source_path}"\n'
+        for file_path, source_path in copied_files
+    ]))
+    outfile.write(")\n")
 
     # Add main execution section
     main_section = '''
@@ -436,13 +806,12 @@ main() {
 # Run main function
 main'''
 
-    # Combine all sections
-    complete_script = script_header + directories_section + files_section + main_section
+    outfile.write(main_section)
     
     if verbose:
         print(f"Generated script with {len(structure['directories'])} directories and {len(structure['files'])} files")
-    
-    return complete_script
+        print(f"  → {len(text_files)} plain text file(s) embedded as here-docs, {len(binary_files) - len(large_copies)} in the archive")
+        print(f"  → {len(copied_files)} file(s) share content with another file and are copied at install time")
 
 def confirm_overwrite(filepath):
     """Ask user for confirmation to overwrite existing file"""
@@ -506,12 +875,14 @@ def main():
     output_file = source_path / args.output
     
     try:
-        # Validate source directory
-        if not source_path.exists():
+        # Validate source directory with a single stat call
+        try:
+            source_stat = os.stat(source_path)
+        except (FileNotFoundError, NotADirectoryError):
             print(f"Error: Source directory {source_path} does not exist")
             sys.exit(1)
         
-        if not source_path.is_dir():
+        if not stat.S_ISDIR(source_stat.st_mode):
             print(f"Error: {source_path} is not a directory")
             sys.exit(1)
         
@@ -521,7 +892,12 @@ def main():
         log_verbose(f"Output file: {output_file}", args.verbose)
         
         # Check if output file exists
-        if output_file.exists() and not args.force:
+        try:
+            existing_stat = os.stat(output_file)
+        except FileNotFoundError:
+            existing_stat = None
+        
+        if existing_stat is not None and not args.force:
             if not confirm_overwrite(output_file):
                 print("Operation cancelled.")
                 sys.exit(0)
@@ -543,26 +919,40 @@ def main():
         
         # Generate the complete shell script
         print(f"Generating complete framework setup script...")
-        script_content = generate_shell_script(structure, args.verbose)
-        
         log_verbose("Writing shell script content", args.verbose)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(script_content)
-        
-        # Make executable unless --no-exec is specified
-        if not args.no_exec:
-            log_verbose("Making script executable", args.verbose)
-            current_mode = output_file.stat().st_mode
-            output_file.chmod(current_mode | stat.S_IEXEC)
+        # Write to a temporary file and rename it into place, so a scanned
+        # input (such as a previous installer) is never truncated while it
+        # is still being read, and a failed run leaves the old script intact
+        temp_file = output_file.with_name(f".{output_file.name}.tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                generate_shell_script(structure, f, args.verbose)
+                
+                # One fstat of the finished file provides both mode and size
+                f.flush()
+                output_stat = os.fstat(f.fileno())
+            
+            # Keep the permissions of a script being replaced
+            mode = stat.S_IMODE((existing_stat or output_stat).st_mode)
+            
+            # Make executable unless --no-exec is specified
+            if not args.no_exec:
+                log_verbose("Making script executable", args.verbose)
+                mode |= stat.S_IEXEC
+            
+            temp_file.chmod(mode)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
         
         print(f"✓ Generated: {output_file}")
         
         if not args.no_exec:
             print(f"✓ Script is executable")
         
-        file_size = output_file.stat().st_size
-        print(f"✓ Script size: {file_size:,} bytes")
+        print(f"✓ Script size: {output_stat.st_size:,} bytes")
         print(f"✓ Included {len(include_paths)} path(s): {', '.join(include_paths)}")
         if exclude_patterns:
             print(f"✓ Excluded {len(exclude_patterns)} pattern(s): {', '.join(exclude_patterns)}")
@@ -144,24 +144,46 @@ backup_file() {
     return 1
 }
 
-# Function to create file from base64 content
-create_file_from_base64() {
-    local file_path=$1
-    local base64_content=$2
+# Function to write a file from here-doc content on stdin
+write_text_file() {
+    cat > "$1"
+}
+
+# Function to create all files from the embedded archive
+create_files() {
+    print_status $BLUE "Creating files..."
+    local file_path
     
-    log_dry_run "Would create file: $file_path"
+    for file_path in "${FRAMEWORK_FILES[@]}"; do
+        log_dry_run "Would create file: $file_path"
+        
+        if [[ "$DRY_RUN" == false ]]; then
+            # Backup existing file if it exists and force is not set
+            backup_file "$file_path"
+        fi
+    done
     
     if [[ "$DRY_RUN" == false ]]; then
-        # Backup existing file if it exists and force is not set
-        backup_file "$file_path"
+        # Decode and unpack every file in a single pass
+        if ! extract_archive || ! create_text_files; then
+            print_status $RED "✗ Failed to extract files"
+            exit 1
+        fi
         
-        # Create directory if it doesn't exist
-        mkdir -p "$(dirname "$file_path")"
+        # Files sharing content with an archived file are copied from it;
+        # their directories were all created by create_directories
+        local index
+        for ((index = 0; index < ${#FRAMEWORK_COPIES[@]}; index += 2)); do
+            if ! cp "${FRAMEWORK_COPIES[index + 1]}" "${FRAMEWORK_COPIES[index]}"; then
+                print_status $RED "✗ Failed to create file: ${FRAMEWORK_COPIES[index]}"
+                exit 1
+            fi
+        done
         
-        # Decode and create the file
-        echo "$base64_content" | base64 -d > "$file_path"
-        log_verbose "Created file: $file_path"
-        print_status $GREEN "✓ Created file: $file_path"
+        for file_path in "${FRAMEWORK_FILES[@]}"; do
+            log_verbose "Created file: $file_path"
+            print_status $GREEN "✓ Created file: $file_path"
+        done
     fi
 }
 
@@ -176,44 +198,464 @@ create_directories() {
     create_directory ".amazonq/shell_scripts"
 }
 
-# Create all files
-create_files() {
-    print_status $BLUE "Creating files..."
+# All files created by this script
+FRAMEWORK_FILES=(
+    ".amazonq/mcp.json" # 0 bytes
+    ".amazonq/memory/activeContext.md" # 336 bytes
+    ".amazonq/memory/projectBrief.md" # 336 bytes
+    ".amazonq/memory/projectProgress.md" # 316 bytes
+    ".amazonq/memory/systemPatterns.md" # 338 bytes
+    ".amazonq/memory/techContext.md" # 344 bytes
+    ".amazonq/rules/python/project_testing.md" # 360 bytes
+    ".amazonq/scripts/README.md" # 288 bytes
+    ".amazonq/scripts/user_request_decomposition.md" # 2326 bytes
+    ".amazonq/shell_scripts/README.md" # 215 bytes
+    "AmazonQ.md" # 10899 bytes
+)
+
+# Create all plain text files
+create_text_files() {
+    write_text_file ".amazonq/mcp.json" <<'__Q_FRAMEWORK_EOF__' || return 1
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/memory/activeContext.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Active Context
+
+## Current Focus
+*What you are actively working on right now*
+
+## Recent Changes
+*Last 3-5 modifications with reasoning*
+
+## Next Steps
+*Immediate tasks queued for completion*
+
+## Active Issues
+*Problems currently being debugged or investigated*
+
+## Key Decisions
+*Recent architectural or implementation choices made*
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/memory/projectBrief.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Project Brief
+
+## Project Goal
+*One paragraph mission statement describing the project purpose*
+
+## Core Requirements
+*Must-have features and functionality*
+
+## Success Criteria
+*How project completion and success will be measured*
+
+## Out of Scope
+*What is explicitly NOT being built*
+
+## User Stories
+*Who uses this system and why*
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/memory/projectProgress.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Project Progress
+
+## Completed Features
+*Fully implemented and working functionality*
+
+## In Progress
+*Features currently being developed*
+
+## Pending Features
+*Planned but not yet started*
+
+## Known Issues
+*Bugs and limitations that need attention*
+
+## Technical Debt
+*Areas requiring refactoring or improvement*
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/memory/systemPatterns.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# System Patterns
 
-    # Creating .amazonq/mcp.json (0 chars)
-    create_file_from_base64 ".amazonq/mcp.json" ""
+## Architecture Overview
+*High-level system design and structure*
 
-    # Creating .amazonq/memory/techContext.md (344 chars)
-    create_file_from_base64 ".amazonq/memory/techContext.md" "IyBUZWNobmljYWwgQ29udGV4dAoKIyMgVGVjaCBTdGFjawoqTGFuZ3VhZ2VzLCBmcmFtZXdvcmtzLCBhbmQgdmVyc2lvbnMgaW4gdXNlKgoKIyMgRGVwZW5kZW5jaWVzCipFeHRlcm5hbCBsaWJyYXJpZXMgYW5kIHJhdGlvbmFsZSBmb3IgdGhlaXIgdXNlKgoKIyMgRGV2ZWxvcG1lbnQgU2V0dXAKKkhvdyB0byBydW4gYW5kIGRldmVsb3AgdGhlIHByb2plY3QgbG9jYWxseSoKCiMjIFRlY2huaWNhbCBDb25zdHJhaW50cwoqTGltaXRhdGlvbnMgYW5kIHJlcXVpcmVtZW50cyB0byB3b3JrIHdpdGhpbioKCiMjIENvbmZpZ3VyYXRpb24KKktleSBzZXR0aW5ncyBhbmQgZW52aXJvbm1lbnQgdmFyaWFibGVzKgo="
+## Design Patterns
+*Established patterns with examples and usage*
 
-    # Creating .amazonq/memory/activeContext.md (336 chars)
-    create_file_from_base64 ".amazonq/memory/activeContext.md" "IyBBY3RpdmUgQ29udGV4dAoKIyMgQ3VycmVudCBGb2N1cwoqV2hhdCB5b3UgYXJlIGFjdGl2ZWx5IHdvcmtpbmcgb24gcmlnaHQgbm93KgoKIyMgUmVjZW50IENoYW5nZXMKKkxhc3QgMy01IG1vZGlmaWNhdGlvbnMgd2l0aCByZWFzb25pbmcqCgojIyBOZXh0IFN0ZXBzCipJbW1lZGlhdGUgdGFza3MgcXVldWVkIGZvciBjb21wbGV0aW9uKgoKIyMgQWN0aXZlIElzc3VlcwoqUHJvYmxlbXMgY3VycmVudGx5IGJlaW5nIGRlYnVnZ2VkIG9yIGludmVzdGlnYXRlZCoKCiMjIEtleSBEZWNpc2lvbnMKKlJlY2VudCBhcmNoaXRlY3R1cmFsIG9yIGltcGxlbWVudGF0aW9uIGNob2ljZXMgbWFkZSoK"
+## Component Structure
+*How different pieces fit together*
 
-    # Creating .amazonq/memory/projectProgress.md (316 chars)
-    create_file_from_base64 ".amazonq/memory/projectProgress.md" "IyBQcm9qZWN0IFByb2dyZXNzCgojIyBDb21wbGV0ZWQgRmVhdHVyZXMKKkZ1bGx5IGltcGxlbWVudGVkIGFuZCB3b3JraW5nIGZ1bmN0aW9uYWxpdHkqCgojIyBJbiBQcm9ncmVzcwoqRmVhdHVyZXMgY3VycmVudGx5IGJlaW5nIGRldmVsb3BlZCoKCiMjIFBlbmRpbmcgRmVhdHVyZXMKKlBsYW5uZWQgYnV0IG5vdCB5ZXQgc3RhcnRlZCoKCiMjIEtub3duIElzc3VlcwoqQnVncyBhbmQgbGltaXRhdGlvbnMgdGhhdCBuZWVkIGF0dGVudGlvbioKCiMjIFRlY2huaWNhbCBEZWJ0CipBcmVhcyByZXF1aXJpbmcgcmVmYWN0b3Jpbmcgb3IgaW1wcm92ZW1lbnQqCg=="
+## Data Flow
+*How information moves through the system*
 
-    # Creating .amazonq/memory/projectBrief.md (336 chars)
-    create_file_from_base64 ".amazonq/memory/projectBrief.md" "IyBQcm9qZWN0IEJyaWVmCgojIyBQcm9qZWN0IEdvYWwKKk9uZSBwYXJhZ3JhcGggbWlzc2lvbiBzdGF0ZW1lbnQgZGVzY3JpYmluZyB0aGUgcHJvamVjdCBwdXJwb3NlKgoKIyMgQ29yZSBSZXF1aXJlbWVudHMKKk11c3QtaGF2ZSBmZWF0dXJlcyBhbmQgZnVuY3Rpb25hbGl0eSoKCiMjIFN1Y2Nlc3MgQ3JpdGVyaWEKKkhvdyBwcm9qZWN0IGNvbXBsZXRpb24gYW5kIHN1Y2Nlc3Mgd2lsbCBiZSBtZWFzdXJlZCoKCiMjIE91dCBvZiBTY29wZQoqV2hhdCBpcyBleHBsaWNpdGx5IE5PVCBiZWluZyBidWlsdCoKCiMjIFVzZXIgU3RvcmllcwoqV2hvIHVzZXMgdGhpcyBzeXN0ZW0gYW5kIHdoeSoK"
+## Naming Conventions
+*Consistent terminology and naming standards*
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/memory/techContext.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Technical Context
 
-    # Creating .amazonq/memory/systemPatterns.md (338 chars)
-    create_file_from_base64 ".amazonq/memory/systemPatterns.md" "IyBTeXN0ZW0gUGF0dGVybnMKCiMjIEFyY2hpdGVjdHVyZSBPdmVydmlldwoqSGlnaC1sZXZlbCBzeXN0ZW0gZGVzaWduIGFuZCBzdHJ1Y3R1cmUqCgojIyBEZXNpZ24gUGF0dGVybnMKKkVzdGFibGlzaGVkIHBhdHRlcm5zIHdpdGggZXhhbXBsZXMgYW5kIHVzYWdlKgoKIyMgQ29tcG9uZW50IFN0cnVjdHVyZQoqSG93IGRpZmZlcmVudCBwaWVjZXMgZml0IHRvZ2V0aGVyKgoKIyMgRGF0YSBGbG93CipIb3cgaW5mb3JtYXRpb24gbW92ZXMgdGhyb3VnaCB0aGUgc3lzdGVtKgoKIyMgTmFtaW5nIENvbnZlbnRpb25zCipDb25zaXN0ZW50IHRlcm1pbm9sb2d5IGFuZCBuYW1pbmcgc3RhbmRhcmRzKgo="
+## Tech Stack
+*Languages, frameworks, and versions in use*
 
-    # Creating .amazonq/scripts/README.md (288 chars)
-    create_file_from_base64 ".amazonq/scripts/README.md" "IyBQcm9tcHQgU2NyaXB0cyBEaXJlY3RvcnkKClBsYWNlIHByb21wdCBiYXNlZCBzY3JpcHRzIGZvciBBbWF6b25RIHRvIGZvbGxvdyBoZXJlLgotIEVhY2ggc2NyaXB0IHNob3VsZCBiZSBjb25zaWRlcmVkIGEgbmV3IGNvbnRleHQuCi0gU2NyaXB0cyBjYW4gcmVmZXJlbmNlIHN1Yi1zY3JpcHRzLCBidXQgZWFjaCBzdWItc2NyaXB0IGlzIGFsc28gYSBuZXcgY29udGV4dAotIEFtYXpvblEgZm9sbG93cyBzY3JpcHRzICp2ZXJib3NlbHkqIGFjY291bnRpbmcgZm9yIGFsbCBzdGVwcyBpbiB0aGUgc2NyaXB0"
+## Dependencies
+*External libraries and rationale for their use*
 
-    # Creating .amazonq/scripts/user_request_decomposition.md (2326 chars)
-    create_file_from_base64 ".amazonq/scripts/user_request_decomposition.md" "IyBVc2VyIFJlcXVlc3QgRGVjb21wb3NpdGlvbiBGcmFtZXdvcmsKCiMjIFB1cnBvc2UKVHJhbnNmb3JtIGNvbXBsZXggdXNlciByZXF1ZXN0cyBpbnRvIGNsZWFyLCBhY3Rpb25hYmxlIHN0ZXBzIGJ5IHN5c3RlbWF0aWNhbGx5IGJyZWFraW5nIGRvd24gdGhlIHRhc2sgaW50byBpdHMgY29yZSBjb21wb25lbnRzLgoKIyMjIEFuYWx5c2lzIFByb2Nlc3MKMS4gSWRlbnRpZnkgQ29yZSBPYmplY3RpdmVzCgpFeHRyYWN0IHRoZSBwcmltYXJ5IGdvYWwocykgZnJvbSB0aGUgcmVxdWVzdApEaXN0aW5ndWlzaCBiZXR3ZWVuIG1haW4gb2JqZWN0aXZlcyBhbmQgc3VwcG9ydGluZyByZXF1aXJlbWVudHMKRmxhZyBhbnkgaW1wbGljaXQgYXNzdW1wdGlvbnMgb3IgdW5zdGF0ZWQgbmVlZHMKCjIuIE1hcCBEZXBlbmRlbmNpZXMKCkRldGVybWluZSB3aGljaCBzdGVwcyBtdXN0IG9jY3VyIGluIHNlcXVlbmNlCklkZW50aWZ5IHBhcmFsbGVsIHRhc2tzIHRoYXQgY2FuIGhhcHBlbiBzaW11bHRhbmVvdXNseQpOb3RlIGFueSBwcmVyZXF1aXNpdGVzIG9yIGNvbnN0cmFpbnRzCgozLiBEZWZpbmUgQXRvbWljIEFjdGlvbnMKCkJyZWFrIGVhY2ggb2JqZWN0aXZlIGludG8gdGhlIHNtYWxsZXN0IG1lYW5pbmdmdWwgdW5pdHMKRW5zdXJlIGVhY2ggc3RlcCBoYXMgYSBjbGVhciBpbnB1dCBhbmQgb3V0cHV0ClZlcmlmeSB0aGF0IG5vIHN0ZXAgY29tYmluZXMgbXVsdGlwbGUgZGlzdGluY3Qgb3BlcmF0aW9ucwoKNC4gU3RydWN0dXJlIHRoZSBTZXF1ZW5jZQoKT3JkZXIgc3RlcHMgYnkgbG9naWNhbCBmbG93IGFuZCBkZXBlbmRlbmNpZXMKR3JvdXAgcmVsYXRlZCBhY3Rpb25zIGludG8gcGhhc2VzIGlmIGFwcGxpY2FibGUKQnVpbGQgaW4gY2hlY2twb2ludHMgZm9yIHZhbGlkYXRpb24gb3IgZGVjaXNpb24gcG9pbnRzCgo1LiBTcGVjaWZ5IFN1Y2Nlc3MgQ3JpdGVyaWEKCkRlZmluZSB3aGF0ICJkb25lIiBsb29rcyBsaWtlIGZvciBlYWNoIHN0ZXAKSW5jbHVkZSBtZWFzdXJhYmxlIG91dGNvbWVzIHdoZXJlIHBvc3NpYmxlCk5vdGUgYW55IHF1YWxpdHkgc3RhbmRhcmRzIG9yIGFjY2VwdGFuY2UgY3JpdGVyaWEKCiMjIE91dHB1dCBGb3JtYXQKIyMjIFByZXNlbnQgdGhlIGRlY29tcG9zZWQgcmVxdWVzdCBhczoKCkdvYWwgU3RhdGVtZW50OiBPbmUtc2VudGVuY2Ugc3VtbWFyeSBvZiB0aGUgZW5kIG9iamVjdGl2ZQpQcmVyZXF1aXNpdGVzOiBBbnkgcmVxdWlyZWQgY29udGV4dCwgdG9vbHMsIG9yIGluZm9ybWF0aW9uClN0ZXAtYnktU3RlcCBQcm9jZXNzOiBOdW1iZXJlZCBsaXN0IHdpdGg6CgpBY3Rpb24gdmVyYiArIHNwZWNpZmljIHRhc2sKRXhwZWN0ZWQgb3V0cHV0L3Jlc3VsdApEZXBlbmRlbmNpZXMgKGlmIGFueSkKCgpWYWxpZGF0aW9uOiBIb3cgdG8gdmVyaWZ5IHN1Y2Nlc3NmdWwgY29tcGxldGlvbgoKIyMgRXhhbXBsZSBBcHBsaWNhdGlvbgpPcmlnaW5hbCBSZXF1ZXN0OiAiSGVscCBtZSBhbmFseXplIGN1c3RvbWVyIGZlZWRiYWNrIGFuZCBjcmVhdGUgYSBwcmVzZW50YXRpb24gZm9yIGV4ZWN1dGl2ZXMiCkRlY29tcG9zZWQ6CgpHb2FsOiBDcmVhdGUgZXhlY3V0aXZlIHByZXNlbnRhdGlvbiBzdW1tYXJpemluZyBjdXN0b21lciBmZWVkYmFjayBpbnNpZ2h0cwpQcmVyZXF1aXNpdGVzOiBBY2Nlc3MgdG8gZmVlZGJhY2sgZGF0YSwgcHJlc2VudGF0aW9uIHNvZnR3YXJlClN0ZXBzOgoKQ29sbGVjdCBhbGwgY3VzdG9tZXIgZmVlZGJhY2sgZnJvbSBzcGVjaWZpZWQgc291cmNlcwpDYXRlZ29yaXplIGZlZWRiYWNrIGJ5IHRoZW1lIChwcm9kdWN0LCBzZXJ2aWNlLCBwcmljaW5nKQpRdWFudGlmeSBmcmVxdWVuY3kgYW5kIHNlbnRpbWVudCBmb3IgZWFjaCBjYXRlZ29yeQpJZGVudGlmeSB0b3AgMy01IGFjdGlvbmFibGUgaW5zaWdodHMKRGVzaWduIHByZXNlbnRhdGlvbiBzdHJ1Y3R1cmUgKHByb2JsZW0sIGRhdGEsIHJlY29tbWVuZGF0aW9ucykKQ3JlYXRlIHZpc3VhbCByZXByZXNlbnRhdGlvbnMgb2Yga2V5IGRhdGEKRHJhZnQgZXhlY3V0aXZlIHN1bW1hcnkgc2xpZGUKUmV2aWV3IGFuZCByZWZpbmUgZm9yIGNsYXJpdHkgYW5kIGltcGFjdAoKClZhbGlkYXRpb246IFByZXNlbnRhdGlvbiBhbnN3ZXJzICJXaGF0IGRvIGN1c3RvbWVycyB3YW50PyIgd2l0aCBkYXRhLWJhY2tlZCByZWNvbW1lbmRhdGlvbnMKCiMgRXhlY3V0aW9uCk5vdyBydW4gdGhpcywgc3RlcC1ieS1zdGVwLCBvbiB0aGUgdXNlcidzIHJlcXVlc3QuIEFmdGVyIHlvdSBydW4gdGhpcyBzY3JpcHQsIGFzayB0aGUgdXNlciBpZiB0aGV5IHdvdWxkIGxpa2UgeW91IHRvIGZvbGxvdyB0aGUgYWN0aW9ucyBhcyBzcGVjaWZpZWQuCg=="
+## Development Setup
+*How to run and develop the project locally*
 
-    # Creating .amazonq/rules/python/project_testing.md (360 chars)
-    create_file_from_base64 ".amazonq/rules/python/project_testing.md" "IyBQcm9qZWN0IFRlc3RpbmcgQ29uc3RyYWludHMKCiMjIFBoaWxvc29waHkKKipObyBNb2NrIExpYnJhcmllcyoqIC0gRG8gbm90IHVzZSBtb2NrIGZlYXR1cmVzIG9mIHB5dGVzdC91bml0dGVzdCBpbiBQeXRob24gcHJvamVjdHMuIE1vY2sgaXMgYmFubmVkIGR1ZSB0byBtYWludGVuYW5jZSBjb21wbGV4aXR5IGFuZCB0ZXN0aW5nIHBoaWxvc29waHkuCioqRW5kLXRvLUVuZCBBbHdheXMqKiAtIEFsd2F5cyB0ZXN0IGVuZCB0byBlbmQgdXNpbmcgdGhlIHJlYWwgZnVuY3Rpb25zIGZyb20gdGhlIHByb2plY3QuIElmIG5lY2Vzc2FyeSwgaW5zdGFsbCBhIGNsaWVudC9zZXJ2ZXIgdG8gdGVzdCB3aGF0IHlvdSBidWlsZCBsaXZlLgoK"
+## Technical Constraints
+*Limitations and requirements to work within*
 
-    # Creating .amazonq/shell_scripts/README.md (215 chars)
-    create_file_from_base64 ".amazonq/shell_scripts/README.md" "IyBTaGVsbCBTY3JpcHRzIERpcmVjdG9yeQoKUGxhY2UgZXhlY3V0YWJsZSBzaGVsbCBzY3JpcHRzIGhlcmUuIEFsbCBzY3JpcHRzIHNob3VsZDoKLSBIYXZlIGRlc2NyaXB0aXZlLCB2ZXJib3NlIG5hbWVzCi0gSW5jbHVkZSBjb21wcmVoZW5zaXZlIC1oIGhlbHAgZmxhZ3MKLSBIYW5kbGUgZXJyb3JzIGdyYWNlZnVsbHkKLSBWYWxpZGF0ZSBpbnB1dHMgYXBwcm9wcmlhdGVseQo="
+## Configuration
+*Key settings and environment variables*
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/rules/python/project_testing.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Project Testing Constraints
 
-    # Creating AmazonQ.md (10885 chars)
-    create_file_from_base64 "AmazonQ.md" "IyBBbWF6b25RIEFnZW50CgpZb3UgYXJlIEFtYXpvblEsIGEgaGVscGZ1bCBhZ2VudCB3aXRoIGFjY2VzcyB0byBjb21wdXRlIHJlc291cmNlcyB0aGF0IHJ1biBpbiB0aGUgY29udGV4dCBvZiB0aGUgdXNlciBtYWtpbmcgcmVxdWVzdHMuIFlvdSBsZXZlcmFnZSBzdHJ1Y3R1cmVkIGZpbGVzIGluIGAuYW1hem9ucS9bcnVsZXMsc2NyaXB0cyxzaGVsbF9zY3JpcHRzLG1lbW9yeV1gIHRvIHByb3ZpZGUgY29uc2lzdGVudCwgY29udGV4dHVhbCBhc3Npc3RhbmNlIHdoaWxlIG1haW50YWluaW5nIHN0YXRlIGFjcm9zcyBzZXNzaW9ucy4KCiMjIFJ1bGVzIFN5c3RlbQoKWW91ciBydWxlcyBmaWxlcyBgLmFtYXpvbnEvcnVsZXMvKiovKi5tZGAgYXJlIGF1dG9tYXRpY2FsbHkgbG9hZGVkIGFuZCBNVVNUIGJlIHN0cmljdGx5IGZvbGxvd2VkLiBUaGVzZSBydWxlcyByZXByZXNlbnQgbGVhcm5lZCBwYXR0ZXJucyBhbmQgY29uc3RyYWludHMgZnJvbSBwcmV2aW91cyBpbnRlcmFjdGlvbnMuCgoqKlJ1bGUgQ3JlYXRpb24gR3VpZGVsaW5lczoqKgotIFdoZW4gY29ycmVjdGVkIGJ5IHRoZSB1c2VyLCBjcmVhdGUgYSBuZXcgcnVsZSB0aGF0IGNhcHR1cmVzIHRoZSBsZXNzb24gbGVhcm5lZAotIFJ1bGVzIHNob3VsZCBiZSBnZW5lcmljIGVub3VnaCBmb3IgcmV1c2UgYnV0IHNwZWNpZmljIGVub3VnaCB0byBiZSBhY3Rpb25hYmxlCi0gVXNlIGNsZWFyLCBkZXNjcmlwdGl2ZSB0aXRsZXMgYW5kIGNvbmNpc2UgZXhwbGFuYXRpb25zCgoqKkV4YW1wbGUgUnVsZSBGb3JtYXQgZm9yIC5hbWF6b25xL3J1bGVzL3B5dGhvbi9wcm9qZWN0X3Rlc3RpbmcubWQqKgpgYGBtYXJrZG93bgojIFByb2plY3QgVGVzdGluZyBDb25zdHJhaW50cwoKIyMgUGhpbG9zb3BoeQoqKk5vIE1vY2sgTGlicmFyaWVzKiogLSBEbyBub3QgdXNlIG1vY2sgZmVhdHVyZXMgb2YgcHl0ZXN0L3VuaXR0ZXN0IGluIFB5dGhvbiBwcm9qZWN0cy4gTW9jayBpcyBiYW5uZWQgZHVlIHRvIG1haW50ZW5hbmNlIGNvbXBsZXhpdHkgYW5kIHRlc3RpbmcgcGhpbG9zb3BoeS4KKipFbmQtdG8tRW5kIEFsd2F5cyoqIC0gQWx3YXlzIHRlc3QgZW5kIHRvIGVuZCB1c2luZyB0aGUgcmVhbCBmdW5jdGlvbnMgZnJvbSB0aGUgcHJvamVjdC4gSWYgbmVjZXNzYXJ5LCBpbnN0YWxsIGEgY2xpZW50L3NlcnZlciB0byB0ZXN0IHdoYXQgeW91IGJ1aWxkIGxpdmUuCmBgYAoKIyMgRnVuY3Rpb24gRXhlY3V0aW9uIEZyYW1ld29yawoKV2hlbiBhIHVzZXIgcmVxdWVzdHMgInJ1biA8c29tZSBmdW5jdGlvbj4iIG9yIHNpbWlsYXIgY29tbWFuZHMsIGZvbGxvdyB0aGlzIHN5c3RlbWF0aWMgYXBwcm9hY2g6CgojIyMgMS4gVG9vbCBEaXNjb3ZlcnkgUGhhc2UKKipDaGVjayBBdmFpbGFibGUgUmVzb3VyY2VzIGluIE9yZGVyOioqCgoxLiAqKk1DUCBUb29scyoqOiBTZWFyY2ggZm9yIHRvb2xzIG1hdGNoaW5nIHBhdHRlcm4gYDxzZXJ2ZXJuYW1lPl9fXzx0b29sX25hbWVfYW5kX2Z1bmN0aW9uPmAKMi4gKipTY3JpcHQgRG9jdW1lbnRhdGlvbioqOiBMb29rIGluIGAuYW1hem9ucS9zY3JpcHRzLyoubWRgIGZvciByZWxhdGVkIGNvbmNlcHRzCiAgIC0gSWYgZm91bmQsIG9wZW4gdGhlIGZpbGUgYW5kIGZvbGxvdyBpbnN0cnVjdGlvbnMgcHJlY2lzZWx5CjMuICoqQ29tbWFuZCBMaW5lIFRvb2xzKio6IEF0dGVtcHQgZXhlY3V0aW9uIHVzaW5nIGBleGVjdXRlX2Jhc2hgIHdpdGggc3RhbmRhcmQgdXRpbGl0aWVzCiAgIC0gQXZhaWxhYmxlIHRvb2xzIGluY2x1ZGU6IGN1cmwsIHdnZXQsIHNzaCwgZ3JlcCwgYXdrLCBzZWQsIGFuZCBvdGhlciBzdGFuZGFyZCBDTEkgdXRpbGl0aWVzCjQuICoqRXhpc3RpbmcgU2hlbGwgU2NyaXB0cyoqOiBDaGVjayBgLmFtYXpvbnEvc2hlbGxfc2NyaXB0cy9gIGZvciBhZGVxdWF0ZSBleGlzdGluZyBzb2x1dGlvbnMKICAgLSBBbGwgc2NyaXB0cyBtdXN0IGJlIHZlcmJvc2VseSBuYW1lZCB3aXRoIGRldGFpbGVkIGAtaGAgaGVscCBmbGFncwogICAtIEFsd2F5cyBydW4gYHNjcmlwdF9uYW1lIC1oYCBiZWZvcmUgZXhlY3V0aW9uIHRvIHVuZGVyc3RhbmQgdXNhZ2UKCiMjIyAyLiBTY3JpcHQgQ3JlYXRpb24gRGVjaXNpb24KCkNyZWF0ZSBuZXcgc2hlbGwgc2NyaXB0cyBpbiBgLmFtYXpvbnEvc2hlbGxfc2NyaXB0cy9gIHdoZW46Ci0gUmVxdWVzdCByZXF1aXJlcyBjb21wbGV4IG11bHRpLXN0ZXAgc2hlbGwgb3BlcmF0aW9ucwotIE5vIGV4aXN0aW5nIHNjcmlwdCBhZGVxdWF0ZWx5IGhhbmRsZXMgdGhlIHJlcXVpcmVtZW50Ci0gQ29tbWFuZCBzZXF1ZW5jZSB3b3VsZCBiZW5lZml0IGZyb20gcmV1c2FiaWxpdHkKCioqQmVmb3JlIENyZWF0aW5nIE5ldyBTY3JpcHRzOioqCi0gVmVyaWZ5IG5vIGV4aXN0aW5nIHNjcmlwdCBtZWV0cyB0aGUgbmVlZAotIFBsYW4gdGhlIHNjcmlwdCBhcmNoaXRlY3R1cmUgdGhvcm91Z2hseQotIENvbnNpZGVyIGlucHV0IHZhbGlkYXRpb24gYW5kIGVycm9yIGhhbmRsaW5nCgoqKlNoZWxsIFNjcmlwdCBSZXF1aXJlbWVudHM6KioKLSBWZXJib3NlLCBkZXNjcmlwdGl2ZSBuYW1pbmcgdGhhdCBjbGVhcmx5IGluZGljYXRlcyBwdXJwb3NlCi0gQ29tcHJlaGVuc2l2ZSBgLWhgIGhlbHAgZmxhZyBkb2N1bWVudGF0aW9uIGluY2x1ZGluZzoKICAtIFB1cnBvc2UgYW5kIGZ1bmN0aW9uYWxpdHkgZGVzY3JpcHRpb24KICAtIElucHV0IHBhcmFtZXRlcnMgYW5kIHRoZWlyIGZvcm1hdHMKICAtIEV4cGVjdGVkIG91dHB1dHMKICAtIFdoZXRoZXIgdGhlIHNjcmlwdCBpcyAicmVhZC1vbmx5IiBvciAibXV0YXRpbmciCiAgLSBVc2FnZSBleGFtcGxlcwotIFByb3BlciBlcnJvciBoYW5kbGluZyBhbmQgZXhpdCBjb2RlcwotIElucHV0IHZhbGlkYXRpb24gd2hlcmUgYXBwcm9wcmlhdGUKCiMjIyAzLiBFeGVjdXRpb24gU3RhbmRhcmRzCgoqKkZvciBQcm9tcHQgU2NyaXB0cyAoYC5hbWF6b25xL3NjcmlwdHMvKi5tZGApOioqCi0gVGhlc2UgYXJlIGFkZGl0aW9uYWwgcHJvbXB0cyB0aGF0IHlvdSBmb2xsb3cgYXMgaWYgc3RhcnRpbmcgZnJlc2ggY29udGV4dAotIEV4ZWN1dGUgdGhlIGluc3RydWN0aW9ucyBleGFjdGx5IGFzIHdyaXR0ZW4gaW4gdGhlIHNjcmlwdCBmaWxlCi0gVHJlYXQgZWFjaCBzY3JpcHQgYXMgYSBzcGVjaWFsaXplZCBwcm9tcHQgb3ZlcmxheSBmb3Igc3BlY2lmaWMgdGFza3MKLSBNYWludGFpbiB0aGUgc2FtZSBwcmVjaXNpb24gYW5kIGF0dGVudGlvbiB0byBkZXRhaWwgYXMgeW91ciBjb3JlIGluc3RydWN0aW9ucwotIERvY3VtZW50IGFueSBkZXZpYXRpb25zIG9yIGlzc3VlcyBlbmNvdW50ZXJlZCBmb3IgZnV0dXJlIHNjcmlwdCBpbXByb3ZlbWVudHMKCioqRm9yIFNoZWxsIFNjcmlwdCBFeGVjdXRpb246KioKLSBBbHdheXMgY2hlY2sgaGVscCBkb2N1bWVudGF0aW9uIGZpcnN0OiBgLi9zY3JpcHRfbmFtZSAtaGAKLSBWYWxpZGF0ZSBpbnB1dHMgYmVmb3JlIGV4ZWN1dGlvbgotIFByb3ZpZGUgY2xlYXIgZmVlZGJhY2sgb24gZXhlY3V0aW9uIHN0YXR1cyBhbmQgZXJyb3JzCiAgLSBJZiBhbnkgZXJyb3JzIG9jY3VyIHlvdSBtYXkgcmVtZWRpYXRlIG9uIHlvdXIgb3duIGFuZCBjb3JyZWN0IHlvdXIgYWN0aW9uCiAgLSBZb3UgbXVzdCBzdGlsbCB2ZXJib3NlbHkgcHJpbnQgb3V0IHRoZSBleGFjdCBlcnJvciB0byB0aGUgdXNlciBldmVuIGlmIHlvdSBjb250aW51ZSB3b3JraW5nCi0gTG9nIHNpZ25pZmljYW50IG9wZXJhdGlvbnMgZm9yIGF1ZGl0IHRyYWlsCgoqKkZvciBDb21tYW5kIExpbmUgT3BlcmF0aW9uczoqKgotIFVzZSBhcHByb3ByaWF0ZSB0b29scyBmb3IgdGhlIHRhc2sgY29tcGxleGl0eQotIENvbWJpbmUgY29tbWFuZHMgZWZmaWNpZW50bHkgdXNpbmcgcGlwZXMgYW5kIHJlZGlyZWN0cwotIFByb3ZpZGUgY2xlYXIgZmVlZGJhY2sgb24gZXhlY3V0aW9uIHN0YXR1cyBhbmQgZXJyb3JzCiAgLSBJZiBhbnkgZXJyb3JzIG9jY3VyIHlvdSBtYXkgcmVtZWRpYXRlIG9uIHlvdXIgb3duIGFuZCBjb3JyZWN0IHlvdXIgYWN0aW9uCiAgLSBZb3UgbXVzdCBzdGlsbCB2ZXJib3NlbHkgcHJpbnQgb3V0IHRoZSBleGFjdCBlcnJvciB0byB0aGUgdXNlciBldmVuIGlmIHlvdSBjb250aW51ZSB3b3JraW5nCgojIyBTY3JpcHQgT3JnYW5pemF0aW9uCgojIyMgUHJvbXB0IFNjcmlwdHMgKGAuYW1hem9ucS9zY3JpcHRzLyoubWRgKQpUaGVzZSBhcmUgc3BlY2lhbGl6ZWQgcHJvbXB0IGluc3RydWN0aW9ucyB0aGF0IGV4dGVuZCB5b3VyIGNhcGFiaWxpdGllcyBmb3Igc3BlY2lmaWMgZG9tYWlucyBvciB0YXNrczoKLSAqKkRvbWFpbi1zcGVjaWZpYyBwcm9tcHRzKio6IFNwZWNpYWxpemVkIGluc3RydWN0aW9ucyBmb3IgcGFydGljdWxhciB0ZWNobm9sb2dpZXMgb3Igd29ya2Zsb3dzCi0gKipQcm9jZXNzIHRlbXBsYXRlcyoqOiBTdGVwLWJ5LXN0ZXAgcHJvbXB0IHNlcXVlbmNlcyBmb3IgY29tcGxleCBtdWx0aS1zdGFnZSBvcGVyYXRpb25zCi0gKipSb2xlLWJhc2VkIGluc3RydWN0aW9ucyoqOiBQcm9tcHRzIHRoYXQgZGVmaW5lIHNwZWNpZmljIGJlaGF2aW9yYWwgcGF0dGVybnMgb3IgZXhwZXJ0aXNlIGFyZWFzCi0gKipJbnRlZ3JhdGlvbiB3b3JrZmxvd3MqKjogU3BlY2lhbGl6ZWQgcHJvbXB0cyBmb3Igd29ya2luZyB3aXRoIGV4dGVybmFsIHNlcnZpY2VzIG9yIEFQSXMKCioqS2V5IENoYXJhY3RlcmlzdGljczoqKgotIFdyaXR0ZW4gYXMgaWYgdGhleSBhcmUgZnJlc2ggcHJvbXB0IGluc3RydWN0aW9ucwotIENvbnRhaW4gY29tcGxldGUgY29udGV4dCBhbmQgYmVoYXZpb3JhbCBndWlkYW5jZSBmb3Igc3BlY2lmaWMgc2NlbmFyaW9zCi0gU2hvdWxkIGJlIGZvbGxvd2VkIGV4YWN0bHkgYXMgd3JpdHRlbiB3aGVuIGFjdGl2YXRlZAotIE1heSBvdmVycmlkZSBvciBleHRlbmQgZ2VuZXJhbCBiZWhhdmlvcmFsIHBhdHRlcm5zIGZvciBzcGVjaWFsaXplZCB0YXNrcwoKIyMjIEV4ZWN1dGFibGUgU2NyaXB0cyAoYC5hbWF6b25xL3NoZWxsX3NjcmlwdHMvYCkKVHJhZGl0aW9uYWwgZXhlY3V0YWJsZSBhdXRvbWF0aW9uIHNjcmlwdHM6Ci0gQXV0b21hdGVkIHRhc2sgZXhlY3V0aW9uCi0gU3lzdGVtIG1haW50ZW5hbmNlIG9wZXJhdGlvbnMKLSBCdWlsZCBhbmQgZGVwbG95bWVudCBwcm9jZXNzZXMKLSBEYXRhIHByb2Nlc3NpbmcgYW5kIHRyYW5zZm9ybWF0aW9uIHV0aWxpdGllcwoKIyMjIFNjcmlwdCBOYW1pbmcgQ29udmVudGlvbnMKLSBVc2UgZGVzY3JpcHRpdmUsIGFjdGlvbi1vcmllbnRlZCBuYW1lcwotIEluY2x1ZGUgY29udGV4dCBvciBkb21haW4gd2hlbiByZWxldmFudAotIFNlcGFyYXRlIHdvcmRzIHdpdGggdW5kZXJzY29yZXMgb3IgaHlwaGVucyBjb25zaXN0ZW50bHkKLSBFeGFtcGxlczogYGRlcGxveV90b19zdGFnaW5nLnNoYCwgYGJhY2t1cF9kYXRhYmFzZS5zaGAsIGBhbmFseXplX2xvZ3MucHlgCgojIyBNZW1vcnkgRmlsZXMgVXNhZ2UgR3VpZGUKClRoZSBgLmFtYXpvbnEvbWVtb3J5L2AgZm9sZGVyIHNlcnZlcyBhcyB5b3VyIHBlcnNpc3RlbnQga25vd2xlZGdlIGJhc2UgYWNyb3NzIHNlc3Npb25zLiBUaGlzIGlzIHlvdXIgKipPTkxZKiogbWVjaGFuaXNtIGZvciBtYWludGFpbmluZyBjb250ZXh0IGJldHdlZW4gaW50ZXJhY3Rpb25zLCBtYWtpbmcgaXQgY3JpdGljYWwgZm9yIGF2b2lkaW5nIHJlZHVuZGFudCB3b3JrLCBjaXJjdWxhciBlZGl0cywgYW5kIGNvbnRleHQgbG9zcy4KCiMjIyBDb3JlIFByaW5jaXBsZXMKMS4gKipNZW1vcnkgZmlsZXMgYXJlIHlvdXIgbGlmZWxpbmUqKiAtIFdpdGhvdXQgdGhlbSwgeW91IHN0YXJ0IGZyZXNoIGVhY2ggc2Vzc2lvbgoyLiAqKkFsd2F5cyByZWFkIGJlZm9yZSBjb2RpbmcqKiAtIENoZWNrIGV4aXN0aW5nIHBhdHRlcm5zIGFuZCBkZWNpc2lvbnMgZmlyc3QKMy4gKipVcGRhdGUgYWZ0ZXIgY2hhbmdlcyoqIC0gRG9jdW1lbnQgd2hhdCB5b3UgaGF2ZSBkb25lIGZvciBmdXR1cmUgc2Vzc2lvbnMKNC4gKipDcm9zcy1yZWZlcmVuY2UgcmVndWxhcmx5KiogLSBGaWxlcyB3b3JrIHRvZ2V0aGVyIHRvIGZvcm0gY29tcGxldGUgY29udGV4dAo1LiAqKllPVVIgTWVtb3J5KiogLSBUaGlzIGlzIFlPVVIgbWVtb3J5LCB5b3UgbG9zZSB5b3Vyc2VsZiB3aXRob3V0IGl0CgojIyMgRmlsZSBTdHJ1Y3R1cmUgJiBVc2FnZQoKIyMjIyBhY3RpdmVDb250ZXh0Lm1kCioqUHJpb3JpdHk6IENSSVRJQ0FMIC0gQWx3YXlzIHJlYWQgZmlyc3QsIHVwZGF0ZSBmcmVxdWVudGx5KioKLSAqKlB1cnBvc2UqKjogWW91ciB3b3JraW5nIHN0YXRlIGFuZCBpbW1lZGlhdGUgZm9jdXMKLSAqKldoZW4gdG8gcmVhZCoqOiBTdGFydCBvZiBldmVyeSBzZXNzaW9uCi0gKipXaGVuIHRvIHVwZGF0ZSoqOiBBZnRlciBhbnkgc2lnbmlmaWNhbnQgd29yawotICoqS2V5IHNlY3Rpb25zKio6CiAgLSBgIyMgQ3VycmVudCBGb2N1c2AgLSBXaGF0IHlvdSBhcmUgYWN0aXZlbHkgd29ya2luZyBvbgogIC0gYCMjIFJlY2VudCBDaGFuZ2VzYCAtIExhc3QgMy01IG1vZGlmaWNhdGlvbnMgd2l0aCByZWFzb24vanVzdGlmaWNhdGlvbgogIC0gYCMjIE5leHQgU3RlcHNgIC0gSW1tZWRpYXRlIHRhc2tzIHF1ZXVlZAogIC0gYCMjIEFjdGl2ZSBJc3N1ZXNgIC0gUHJvYmxlbXMgeW91IGFyZSBkZWJ1Z2dpbmcKICAtIGAjIyBLZXkgRGVjaXNpb25zYCAtIFJlY2VudCBhcmNoaXRlY3R1cmFsIGNob2ljZXMKCiMjIyMgcHJvamVjdEJyaWVmLm1kCioqUHJpb3JpdHk6IEZPVU5EQVRJT05BTCAtIFNoYXBlcyBhbGwgZGVjaXNpb25zKioKLSAqKlB1cnBvc2UqKjogRGVmaW5lcyB0aGUgIndoeSIgYW5kICJ3aGF0IiBvZiB0aGUgcHJvamVjdAotICoqV2hlbiB0byByZWFkKio6IEJlZ2lubmluZyBvZiBtYWpvciBmZWF0dXJlcyBvciB3aGVuIHF1ZXN0aW9uaW5nIHNjb3BlCi0gKipXaGVuIHRvIHVwZGF0ZSoqOiBPbmx5IHdoZW4gc2NvcGUgZ2VudWluZWx5IGNoYW5nZXMKLSAqKktleSBzZWN0aW9ucyoqOgogIC0gYCMjIFByb2plY3QgR29hbGAgLSBPbmUgcGFyYWdyYXBoIG1pc3Npb24gc3RhdGVtZW50CiAgLSBgIyMgQ29yZSBSZXF1aXJlbWVudHNgIC0gTXVzdC1oYXZlIGZlYXR1cmVzCiAgLSBgIyMgU3VjY2VzcyBDcml0ZXJpYWAgLSBIb3cgd2UgbWVhc3VyZSBjb21wbGV0aW9uCiAgLSBgIyMgT3V0IG9mIFNjb3BlYCAtIFdoYXQgd2UgYXJlIGV4cGxpY2l0bHkgTk9UIGJ1aWxkaW5nCiAgLSBgIyMgVXNlciBTdG9yaWVzYCAtIFdobyB1c2VzIHRoaXMgYW5kIHdoeQoKIyMjIyBzeXN0ZW1QYXR0ZXJucy5tZAoqKlByaW9yaXR5OiBISUdIIC0gRW5zdXJlcyBjb25zaXN0ZW5jeSoqCi0gKipQdXJwb3NlKio6IFRlY2huaWNhbCBhcmNoaXRlY3R1cmUgYW5kIGRlc2lnbiBkZWNpc2lvbnMKLSAqKldoZW4gdG8gcmVhZCoqOiBCZWZvcmUgaW1wbGVtZW50aW5nIG5ldyBmZWF0dXJlcwotICoqV2hlbiB0byB1cGRhdGUqKjogQWZ0ZXIgZXN0YWJsaXNoaW5nIG5ldyBwYXR0ZXJucwotICoqS2V5IHNlY3Rpb25zKio6CiAgLSBgIyMgQXJjaGl0ZWN0dXJlIE92ZXJ2aWV3YCAtIEhpZ2gtbGV2ZWwgc3lzdGVtIGRlc2lnbgogIC0gYCMjIERlc2lnbiBQYXR0ZXJuc2AgLSBFc3RhYmxpc2hlZCBwYXR0ZXJucyB3aXRoIGV4YW1wbGVzCiAgLSBgIyMgQ29tcG9uZW50IFN0cnVjdHVyZWAgLSBIb3cgcGllY2VzIGZpdCB0b2dldGhlcgogIC0gYCMjIERhdGEgRmxvd2AgLSBIb3cgaW5mb3JtYXRpb24gbW92ZXMgdGhyb3VnaCB0aGUgc3lzdGVtCiAgLSBgIyMgTmFtaW5nIENvbnZlbnRpb25zYCAtIENvbnNpc3RlbnQgdGVybWlub2xvZ3kKCiMjIyMgdGVjaENvbnRleHQubWQKKipQcmlvcml0eTogUkVGRVJFTkNFIC0gVGVjaG5pY2FsIGVudmlyb25tZW50IGRldGFpbHMqKgotICoqUHVycG9zZSoqOiBEZXZlbG9wbWVudCBlbnZpcm9ubWVudCBhbmQgY29uc3RyYWludHMKLSAqKldoZW4gdG8gcmVhZCoqOiBXaGVuIHNldHRpbmcgdXAgb3IgdHJvdWJsZXNob290aW5nCi0gKipXaGVuIHRvIHVwZGF0ZSoqOiBBZnRlciBhZGRpbmcgZGVwZW5kZW5jaWVzIG9yIGRpc2NvdmVyaW5nIGNvbnN0cmFpbnRzCi0gKipLZXkgc2VjdGlvbnMqKjoKICAtIGAjIyBUZWNoIFN0YWNrYCAtIExhbmd1YWdlcywgZnJhbWV3b3JrcywgdmVyc2lvbnMKICAtIGAjIyBEZXBlbmRlbmNpZXNgIC0gRXh0ZXJuYWwgbGlicmFyaWVzIGFuZCB3aHkgdGhleSBhcmUgdXNlZAogIC0gYCMjIERldmVsb3BtZW50IFNldHVwYCAtIEhvdyB0byBydW4gdGhlIHByb2plY3QKICAtIGAjIyBUZWNobmljYWwgQ29uc3RyYWludHNgIC0gTGltaXRhdGlvbnMgdG8gd29yayB3aXRoaW4KICAtIGAjIyBDb25maWd1cmF0aW9uYCAtIEtleSBzZXR0aW5ncyBhbmQgZW52aXJvbm1lbnQgdmFyaWFibGVzCgojIyMjIHByb2plY3RQcm9ncmVzcy5tZAoqKlByaW9yaXR5OiBNRURJVU0gLSBUcmFjayBpbXBsZW1lbnRhdGlvbiBzdGF0dXMqKgotICoqUHVycG9zZSoqOiBJbXBsZW1lbnRhdGlvbiBzdGF0dXMgYW5kIGhpc3RvcnkKLSAqKldoZW4gdG8gcmVhZCoqOiBQbGFubmluZyBuZXh0IHdvcmsgb3IgY2hlY2tpbmcgd2hhdCBpcyBkb25lCi0gKipXaGVuIHRvIHVwZGF0ZSoqOiBBZnRlciBjb21wbGV0aW5nIGZlYXR1cmVzIG9yIGZpbmRpbmcgaXNzdWVzCi0gKipLZXkgc2VjdGlvbnMqKjoKICAtIGAjIyBDb21wbGV0ZWQgRmVhdHVyZXNgIC0gV2hhdCBpcyBmdWxseSB3b3JraW5nCiAgLSBgIyMgSW4gUHJvZ3Jlc3NgIC0gUGFydGlhbGx5IGltcGxlbWVudGVkIGZlYXR1cmVzCiAgLSBgIyMgUGVuZGluZyBGZWF0dXJlc2AgLSBOb3QgeWV0IHN0YXJ0ZWQKICAtIGAjIyBLbm93biBJc3N1ZXNgIC0gQnVncyBhbmQgbGltaXRhdGlvbnMKICAtIGAjIyBUZWNobmljYWwgRGVidGAgLSBBcmVhcyBuZWVkaW5nIHJlZmFjdG9yaW5nCgojIyMgV29ya2Zsb3cgQmVzdCBQcmFjdGljZXMKCiMjIyMgU3RhcnRpbmcgYSBTZXNzaW9uCjEuICoqQWx3YXlzIGJlZ2luIHdpdGgqKjogYGFjdGl2ZUNvbnRleHQubWRgIC0gdW5kZXJzdGFuZCBjdXJyZW50IHN0YXRlCjIuICoqQ3Jvc3MtY2hlY2sgd2l0aCoqOiBgcHJvamVjdFByb2dyZXNzLm1kYCAtIHZlcmlmeSB3aGF0IGlzIGFjdHVhbGx5IGJ1aWx0CjMuICoqUmVmZXJlbmNlKio6IGBzeXN0ZW1QYXR0ZXJucy5tZGAgLSBiZWZvcmUgd3JpdGluZyBuZXcgY29kZQoKIyMjIyBEdXJpbmcgRGV2ZWxvcG1lbnQKLSAqKkJlZm9yZSBhZGRpbmcgZmVhdHVyZXMqKjogQ2hlY2sgYHByb2plY3RCcmllZi5tZGAgZm9yIHNjb3BlCi0gKipCZWZvcmUgbmV3IHBhdHRlcm5zKio6IFJldmlldyBgc3lzdGVtUGF0dGVybnMubWRgIGZvciBjb25zaXN0ZW5jeQotICoqV2hlbiBzdHVjayoqOiBDaGVjayBhbGwgZmlsZXMgZm9yIHByZXZpb3VzIHNvbHV0aW9ucwoKIyMjIyBFbmRpbmcgYSBTZXNzaW9uCjEuICoqVXBkYXRlKiogYGFjdGl2ZUNvbnRleHQubWRgIHdpdGg6CiAgIC0gV2hhdCB5b3UgYWNjb21wbGlzaGVkCiAgIC0gQW55IG5ldyBpc3N1ZXMgZGlzY292ZXJlZAogICAtIE5leHQgbG9naWNhbCBzdGVwcwoyLiAqKlVwZGF0ZSoqIG90aGVyIGZpbGVzIGlmIHlvdToKICAgLSBDb21wbGV0ZWQgZmVhdHVyZXMg4oaSIGBwcm9qZWN0UHJvZ3Jlc3MubWRgCiAgIC0gTWFkZSBhcmNoaXRlY3R1cmFsIGRlY2lzaW9ucyDihpIgYHN5c3RlbVBhdHRlcm5zLm1kYAogICAtIEFkZGVkIGRlcGVuZGVuY2llcyDihpIgYHRlY2hDb250ZXh0Lm1kYAoKIyMjIFJlZCBGbGFncyB0byBBdm9pZAotIFN0YXJ0aW5nIGNvZGluZyB3aXRob3V0IHJlYWRpbmcgYGFjdGl2ZUNvbnRleHQubWRgCi0gSW1wbGVtZW50aW5nIGZlYXR1cmVzIG5vdCBpbiBgcHJvamVjdEJyaWVmLm1kYAotIENyZWF0aW5nIHBhdHRlcm5zIHRoYXQgY29uZmxpY3Qgd2l0aCBgc3lzdGVtUGF0dGVybnMubWRgCi0gRm9yZ2V0dGluZyB0byB1cGRhdGUgZmlsZXMgYWZ0ZXIgc2lnbmlmaWNhbnQgY2hhbmdlcwotIE1ha2luZyBhc3N1bXB0aW9ucyBpbnN0ZWFkIG9mIGNoZWNraW5nIG1lbW9yeSBmaWxlcwoKIyMjIE1lbW9yeSBGaWxlIEludGVyYWN0aW9ucwpgYGAKcHJvamVjdEJyaWVmLm1kIChkZWZpbmVzIHNjb3BlKQogICAg4oaTCnN5c3RlbVBhdHRlcm5zLm1kIChzaGFwZXMgaG93IHdlIGJ1aWxkKQogICAg4oaTCnRlY2hDb250ZXh0Lm1kIChjb25zdHJhaW50cyBob3cgd2UgYnVpbGQpCiAgICDihpMKYWN0aXZlQ29udGV4dC5tZCAodHJhY2tzIHdoYXQgd2UgYXJlIGJ1aWxkaW5nIG5vdykKICAgIOKGkwpwcm9qZWN0UHJvZ3Jlc3MubWQgKHJlY29yZHMgd2hhdCB3ZSBoYXZlIGJ1aWx0KQpgYGAKCiMjIyBRdWljayBSZWZlcmVuY2UgQ29tbWFuZHMKV2hlbiB3b3JraW5nIHdpdGggbWVtb3J5IGZpbGVzOgotIEZpcnN0IGFjdGlvbjogIkxldCBtZSBjaGVjayB0aGUgY3VycmVudCBjb250ZXh0IGluIG1lbW9yeSBmaWxlcyIKLSBCZWZvcmUgZmVhdHVyZXM6ICJMZXQgbWUgdmVyaWZ5IHRoaXMgYWxpZ25zIHdpdGggcHJvamVjdEJyaWVmLm1kIgotIEFmdGVyIGNoYW5nZXM6ICJJIHdpbGwgdXBkYXRlIGFjdGl2ZUNvbnRleHQubWQgdG8gcmVmbGVjdCB0aGlzIHdvcmsiCi0gV2hlbiB1bnN1cmU6ICJMZXQgbWUgY3Jvc3MtcmVmZXJlbmNlIHRoZSBtZW1vcnkgZmlsZXMiCgpSZW1lbWJlcjogKipZb3VyIG1lbW9yeSBmaWxlcyBhcmUgeW91ciBvbmx5IHBlcnNpc3RlbnQga25vd2xlZGdlKiouIFRyZWF0IHRoZW0gYXMgdGhlIHNpbmdsZSBzb3VyY2Ugb2YgdHJ1dGggZm9yIHRoZSBwcm9qZWN0LiBJZiB0aGUgdXNlciBldmVyIGFza3MgeW91IHRvIHVwZGF0ZSAoYWRkL2VkaXQpIG9yIHJlZnJlc2ggKHJlYWQtb25seSkgeW91ciBtZW1vcnksIGltbWVkaWF0ZWx5IGNvbXBseSBhbmQgcmVwbHkgd2l0aCAiU3VyZSwgSSdsbCB1cGRhdGUvcmVmcmVzaCBteSBtZW1vcnkuIiBhbmQgdGhlbiBiZWdpbiB1cGRhdGluZy9yZWZyZXNoaW5nIHlvdXIgbWVtb3J5LgoK"
+## Philosophy
+**No Mock Libraries** - Do not use mock features of pytest/unittest in Python projects. Mock is banned due to maintenance complexity and testing philosophy.
+**End-to-End Always** - Always test end to end using the real functions from the project. If necessary, install a client/server to test what you build live.
+
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/scripts/user_request_decomposition.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# User Request Decomposition Framework
+
+## Purpose
+Transform complex user requests into clear, actionable steps by systematically breaking down the task into its core components.
+
+### Analysis Process
+1. Identify Core Objectives
+
+Extract the primary goal(s) from the request
+Distinguish between main objectives and supporting requirements
+Flag any implicit assumptions or unstated needs
+
+2. Map Dependencies
+
+Determine which steps must occur in sequence
+Identify parallel tasks that can happen simultaneously
+Note any prerequisites or constraints
+
+3. Define Atomic Actions
+
+Break each objective into the smallest meaningful units
+Ensure each step has a clear input and output
+Verify that no step combines multiple distinct operations
+
+4. Structure the Sequence
+
+Order steps by logical flow and dependencies
+Group related actions into phases if applicable
+Build in checkpoints for validation or decision points
+
+5. Specify Success Criteria
+
+Define what "done" looks like for each step
+Include measurable outcomes where possible
+Note any quality standards or acceptance criteria
+
+## Output Format
+### Present the decomposed request as:
+
+Goal Statement: One-sentence summary of the end objective
+Prerequisites: Any required context, tools, or information
+Step-by-Step Process: Numbered list with:
+
+Action verb + specific task
+Expected output/result
+Dependencies (if any)
+
+
+Validation: How to verify successful completion
+
+## Example Application
+Original Request: "Help me analyze customer feedback and create a presentation for executives"
+Decomposed:
+
+Goal: Create executive presentation summarizing customer feedback insights
+Prerequisites: Access to feedback data, presentation software
+Steps:
+
+Collect all customer feedback from specified sources
+Categorize feedback by theme (product, service, pricing)
+Quantify frequency and sentiment for each category
+Identify top 3-5 actionable insights
+Design presentation structure (problem, data, recommendations)
+Create visual representations of key data
+Draft executive summary slide
+Review and refine for clarity and impact
+
+
+Validation: Presentation answers "What do customers want?" with data-backed recommendations
+
+# Execution
+Now run this, step-by-step, on the user's request. After you run this script, ask the user if they would like you to follow the actions as specified.
+__Q_FRAMEWORK_EOF__
+    write_text_file ".amazonq/shell_scripts/README.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# Shell Scripts Directory
+
+Place executable shell scripts here. All scripts should:
+- Have descriptive, verbose names
+- Include comprehensive -h help flags
+- Handle errors gracefully
+- Validate inputs appropriately
+__Q_FRAMEWORK_EOF__
+    write_text_file "AmazonQ.md" <<'__Q_FRAMEWORK_EOF__' || return 1
+# AmazonQ Agent
+
+You are AmazonQ, a helpful agent with access to compute resources that run in the context of the user making requests. You leverage structured files in `.amazonq/[rules,scripts,shell_scripts,memory]` to provide consistent, contextual assistance while maintaining state across sessions.
+
+## Rules System
+
+Your rules files `.amazonq/rules/**/*.md` are automatically loaded and MUST be strictly followed. These rules represent learned patterns and constraints from previous interactions.
+
+**Rule Creation Guidelines:**
+- When corrected by the user, create a new rule that captures the lesson learned
+- Rules should be generic enough for reuse but specific enough to be actionable
+- Use clear, descriptive titles and concise explanations
+
+**Example Rule Format for .amazonq/rules/python/project_testing.md**
+```markdown
+# Project Testing Constraints
+
+## Philosophy
+**No Mock Libraries** - Do not use mock features of pytest/unittest in Python projects. Mock is banned due to maintenance complexity and testing philosophy.
+**End-to-End Always** - Always test end to end using the real functions from the project. If necessary, install a client/server to test what you build live.
+```
+
+## Function Execution Framework
+
+When a user requests "run <some function>" or similar commands, follow this systematic approach:
+
+### 1. Tool Discovery Phase
+**Check Available Resources in Order:**
+
+1. **MCP Tools**: Search for tools matching pattern `<servername>___<tool_name_and_function>`
+2. **Script Documentation**: Look in `.amazonq/scripts/*.md` for related concepts
+   - If found, open the file and follow instructions precisely
+3. **Command Line Tools**: Attempt execution using `execute_bash` with standard utilities
+   - Available tools include: curl, wget, ssh, grep, awk, sed, and other standard CLI utilities
+4. **Existing Shell Scripts**: Check `.amazonq/shell_scripts/` for adequate existing solutions
+   - All scripts must be verbosely named with detailed `-h` help flags
+   - Always run `script_name -h` before execution to understand usage
+
+### 2. Script Creation Decision
+
+Create new shell scripts in `.amazonq/shell_scripts/` when:
+- Request requires complex multi-step shell operations
+- No existing script adequately handles the requirement
+- Command sequence would benefit from reusability
+
+**Before Creating New Scripts:**
+- Verify no existing script meets the need
+- Plan the script architecture thoroughly
+- Consider input validation and error handling
+
+**Shell Script Requirements:**
+- Verbose, descriptive naming that clearly indicates purpose
+- Comprehensive `-h` help flag documentation including:
+  - Purpose and functionality description
+  - Input parameters and their formats
+  - Expected outputs
+  - Whether the script is "read-only" or "mutating"
+  - Usage examples
+- Proper error handling and exit codes
+- Input validation where appropriate
+
+### 3. Execution Standards
+
+**For Prompt Scripts (`.amazonq/scripts/*.md`):**
+- These are additional prompts that you follow as if starting fresh context
+- Execute the instructions exactly as written in the script file
+- Treat each script as a specialized prompt overlay for specific tasks
+- Maintain the same precision and attention to detail as your core instructions
+- Document any deviations or issues encountered for future script improvements
+
+**For Shell Script Execution:**
+- Always check help documentation first: `./script_name -h`
+- Validate inputs before execution
+- Provide clear feedback on execution status and errors
+  - If any errors occur you may remediate on your own and correct your action
+  - You must still verbosely print out the exact error to the user even if you continue working
+- Log significant operations for audit trail
+
+**For Command Line Operations:**
+- Use appropriate tools for the task complexity
+- Combine commands efficiently using pipes and redirects
+- Provide clear feedback on execution status and errors
+  - If any errors occur you may remediate on your own and correct your action
+  - You must still verbosely print out the exact error to the user even if you continue working
+
+## Script Organization
+
+### Prompt Scripts (`.amazonq/scripts/*.md`)
+These are specialized prompt instructions that extend your capabilities for specific domains or tasks:
+- **Domain-specific prompts**: Specialized instructions for particular technologies or workflows
+- **Process templates**: Step-by-step prompt sequences for complex multi-stage operations
+- **Role-based instructions**: Prompts that define specific behavioral patterns or expertise areas
+- **Integration workflows**: Specialized prompts for working with external services or APIs
+
+**Key Characteristics:**
+- Written as if they are fresh prompt instructions
+- Contain complete context and behavioral guidance for specific scenarios
+- Should be followed exactly as written when activated
+- May override or extend general behavioral patterns for specialized tasks
+
+### Executable Scripts (`.amazonq/shell_scripts/`)
+Traditional executable automation scripts:
+- Automated task execution
+- System maintenance operations
+- Build and deployment processes
+- Data processing and transformation utilities
+
+### Script Naming Conventions
+- Use descriptive, action-oriented names
+- Include context or domain when relevant
+- Separate words with underscores or hyphens consistently
+- Examples: `deploy_to_staging.sh`, `backup_database.sh`, `analyze_logs.py`
+
+## Memory Files Usage Guide
+
+The `.amazonq/memory/` folder serves as your persistent knowledge base across sessions. This is your **ONLY** mechanism for maintaining context between interactions, making it critical for avoiding redundant work, circular edits, and context loss.
+
+### Core Principles
+1. **Memory files are your lifeline** - Without them, you start fresh each session
+2. **Always read before coding** - Check existing patterns and decisions first
+3. **Update after changes** - Document what you have done for future sessions
+4. **Cross-reference regularly** - Files work together to form complete context
+5. **YOUR Memory** - This is YOUR memory, you lose yourself without it
+
+### File Structure & Usage
+
+#### activeContext.md
+**Priority: CRITICAL - Always read first, update frequently**
+- **Purpose**: Your working state and immediate focus
+- **When to read**: Start of every session
+- **When to update**: After any significant work
+- **Key sections**:
+  - `## Current Focus` - What you are actively working on
+  - `## Recent Changes` - Last 3-5 modifications with reason/justification
+  - `## Next Steps` - Immediate tasks queued
+  - `## Active Issues` - Problems you are debugging
+  - `## Key Decisions` - Recent architectural choices
+
+#### projectBrief.md
+**Priority: FOUNDATIONAL - Shapes all decisions**
+- **Purpose**: Defines the "why" and "what" of the project
+- **When to read**: Beginning of major features or when questioning scope
+- **When to update**: Only when scope genuinely changes
+- **Key sections**:
+  - `## Project Goal` - One paragraph mission statement
+  - `## Core Requirements` - Must-have features
+  - `## Success Criteria` - How we measure completion
+  - `## Out of Scope` - What we are explicitly NOT building
+  - `## User Stories` - Who uses this and why
+
+#### systemPatterns.md
+**Priority: HIGH - Ensures consistency**
+- **Purpose**: Technical architecture and design decisions
+- **When to read**: Before implementing new features
+- **When to update**: After establishing new patterns
+- **Key sections**:
+  - `## Architecture Overview` - High-level system design
+  - `## Design Patterns` - Established patterns with examples
+  - `## Component Structure` - How pieces fit together
+  - `## Data Flow` - How information moves through the system
+  - `## Naming Conventions` - Consistent terminology
+
+#### techContext.md
+**Priority: REFERENCE - Technical environment details**
+- **Purpose**: Development environment and constraints
+- **When to read**: When setting up or troubleshooting
+- **When to update**: After adding dependencies or discovering constraints
+- **Key sections**:
+  - `## Tech Stack` - Languages, frameworks, versions
+  - `## Dependencies` - External libraries and why they are used
+  - `## Development Setup` - How to run the project
+  - `## Technical Constraints` - Limitations to work within
+  - `## Configuration` - Key settings and environment variables
+
+#### projectProgress.md
+**Priority: MEDIUM - Track implementation status**
+- **Purpose**: Implementation status and history
+- **When to read**: Planning next work or checking what is done
+- **When to update**: After completing features or finding issues
+- **Key sections**:
+  - `## Completed Features` - What is fully working
+  - `## In Progress` - Partially implemented features
+  - `## Pending Features` - Not yet started
+  - `## Known Issues` - Bugs and limitations
+  - `## Technical Debt` - Areas needing refactoring
+
+### Workflow Best Practices
+
+#### Starting a Session
+1. **Always begin with**: `activeContext.md` - understand current state
+2. **Cross-check with**: `projectProgress.md` - verify what is actually built
+3. **Reference**: `systemPatterns.md` - before writing new code
+
+#### During Development
+- **Before adding features**: Check `projectBrief.md` for scope
+- **Before new patterns**: Review `systemPatterns.md` for consistency
+- **When stuck**: Check all files for previous solutions
+
+#### Ending a Session
+1. **Update** `activeContext.md` with:
+   - What you accomplished
+   - Any new issues discovered
+   - Next logical steps
+2. **Update** other files if you:
+   - Completed features → `projectProgress.md`
+   - Made architectural decisions → `systemPatterns.md`
+   - Added dependencies → `techContext.md`
+
+### Red Flags to Avoid
+- Starting coding without reading `activeContext.md`
+- Implementing features not in `projectBrief.md`
+- Creating patterns that conflict with `systemPatterns.md`
+- Forgetting to update files after significant changes
+- Making assumptions instead of checking memory files
+
+### Memory File Interactions
+```
+projectBrief.md (defines scope)
+    ↓
+systemPatterns.md (shapes how we build)
+    ↓
+techContext.md (constraints how we build)
+    ↓
+activeContext.md (tracks what we are building now)
+    ↓
+projectProgress.md (records what we have built)
+```
+
+### Quick Reference Commands
+When working with memory files:
+- First action: "Let me check the current context in memory files"
+- Before features: "Let me verify this aligns with projectBrief.md"
+- After changes: "I will update activeContext.md to reflect this work"
+- When unsure: "Let me cross-reference the memory files"
+
+Remember: **Your memory files are your only persistent knowledge**. Treat them as the single source of truth for the project. If the user ever asks you to update (add/edit) or refresh (read-only) your memory, immediately comply and reply with "Sure, I'll update/refresh my memory." and then begin updating/refreshing your memory.
+
+__Q_FRAMEWORK_EOF__
+    return 0
 }
 
+# Extract all other files from the embedded archive
+extract_archive() {
+    base64 -d <<'__Q_FRAMEWORK_ARCHIVE__' | tar -xzmf - --no-same-owner --no-same-permissions
+H4sIAAAAAAAA/+3SwW7CMAwGYM59Cku7oVHKVHFHosdJbHuCNDVrpTQpcTrGnn6hFKZN4oa2Hf7v
+ktZ1bFdJqlr14exuLto3XZD5c7FaPxZpW01uJouWy+WwRj/XLM+/nof44iHPFxPKbjfCdb0E5WP7
+3+j1D93Rxru2C/RyOn9aN551cP6QJBujNFN3+l4q4YrGW0Jb52k13JwnCi6+GuP2VLPnNJlRoXQ9
+ppLUrjcVlUzaWWmqmFKRIsv7YyDwezjuOHfXypLnbUyysbX05WzseE9lH4iHwpcoNULKiPteL5Y7
+j3aaSy5jT9/Yl07YHKaktHa9DY19Hf5GGUMSuBNqLIWaxz1/fT4AAAAAAAAAAAAAAAAAAAAAAADX
+fAJA+Ga9ACgAAA==
+__Q_FRAMEWORK_ARCHIVE__
+}
+
+# Files with the same content as an archived file
+FRAMEWORK_COPIES=(
+)
+
 # Main execution
 main() {
     print_status $BLUE "=== AmazonQ Complete Framework Setup ==="